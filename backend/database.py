@@ -2,6 +2,14 @@
 Career and skills database
 Expand this with real data from O*NET, LinkedIn, etc.
 """
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Tuple
+
+# Canonical case normalization for every skill, interest and career comparison.
+# casefold() is the Unicode-aware caseless form (e.g. "ß" -> "ss"), unlike lower()
+normalize_skill = str.casefold
 
 CAREER_DATABASE = {
     "Data Scientist": {
@@ -161,22 +169,75 @@ CAREER_DATABASE = {
     }
 }
 
+# Read-only at runtime: freeze each career record and the database itself
+CAREER_DATABASE = MappingProxyType({
+    career: MappingProxyType({
+        field: tuple(value) if isinstance(value, list) else value
+        for field, value in details.items()
+    })
+    for career, details in CAREER_DATABASE.items()
+})
+
+@dataclass(frozen=True, slots=True)
+class CareerRecord:
+    """Immutable career details with attribute access"""
+    required_skills: Tuple[str, ...]
+    nice_to_have: Tuple[str, ...]
+    description: str
+    avg_salary: str
+    growth_outlook: str
+    education_required: str
+    industry: Tuple[str, ...]
+
+# Career records, instantiated once for fast field access in hot loops
+CAREER_RECORDS = MappingProxyType({
+    career: CareerRecord(**details)
+    for career, details in CAREER_DATABASE.items()
+})
+
+# Lowercased skill sets per career, built once for O(1) set math
+CAREER_SKILL_SETS = {
+    career: {
+        "required": frozenset(normalize_skill(s) for s in details['required_skills']),
+        "nice_to_have": frozenset(normalize_skill(s) for s in details['nice_to_have'])
+    }
+    for career, details in CAREER_DATABASE.items()
+}
+
+@lru_cache(maxsize=1)
 def get_all_careers():
-    """Get list of all career titles"""
-    return list(CAREER_DATABASE.keys())
+    """Get list of all career titles (computed once)"""
+    return tuple(CAREER_DATABASE.keys())
 
 def get_career_details(career_name: str):
     """Get details for a specific career"""
-    return CAREER_DATABASE.get(career_name)
+    return CAREER_RECORDS.get(career_name)
+
+def _build_skill_index():
+    """Map each lowercased skill to the careers that list it"""
+    index = {}
+    for career, details in CAREER_DATABASE.items():
+        for s in details['required_skills'] + details['nice_to_have']:
+            careers = index.setdefault(normalize_skill(s), [])
+            if career not in careers:
+                careers.append(career)
+    return index
+
+# Inverted index: skill -> careers, built once at import time
+_SKILL_INDEX = _build_skill_index()
 
 def search_careers_by_skill(skill: str):
     """Find careers that require a specific skill"""
-    matching_careers = []
-    skill_lower = skill.lower()
-    
-    for career, details in CAREER_DATABASE.items():
-        all_skills = details['required_skills'] + details['nice_to_have']
-        if any(skill_lower in s.lower() for s in all_skills):
-            matching_careers.append(career)
+    return list(_search_careers_lower(normalize_skill(skill)))
+
+@lru_cache(maxsize=1024)
+def _search_careers_lower(skill_lower: str):
+    """Careers matching an already-lowercased skill query (memoized)"""
+    # Substring match over the unique skill names instead of every career
+    matched = set()
+    for skill_key, careers in _SKILL_INDEX.items():
+        if skill_lower in skill_key:
+            matched.update(careers)
     
-    return matching_careers
\ No newline at end of file
+    # Preserve database order
+    return tuple(career for career in CAREER_DATABASE if career in matched)
\ No newline at end of file
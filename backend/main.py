@@ -1,9 +1,14 @@
 """
 Main FastAPI application - AI Career Mentor Backend
 """
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, Request, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
+import asyncio
+import os
 import sys
 from pathlib import Path
 
@@ -16,7 +21,7 @@ from backend.models import (
     ResumeParseResponse
 )
 from backend.parser import ResumeParser
-from backend.recommender import CareerRecommender
+from backend.recommender import CareerNotFoundError, CareerRecommender
 from backend.database import get_all_careers, get_career_details
 
 # Initialize FastAPI app
@@ -26,18 +31,42 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Browser origins allowed to call the API (comma-separated override via env)
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get(
+        "CORS_ALLOWED_ORIGINS",
+        "http://localhost:8501,http://127.0.0.1:8501"
+    ).split(",")
+    if origin.strip()
+]
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify actual origins
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress JSON responses such as recommendation lists and career details
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Initialize recommender
 recommender = CareerRecommender()
 
+# Worker pool for CPU-bound resume parsing, keeps the event loop responsive
+_PARSE_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(),
+    thread_name_prefix="resume-parser"
+)
+
+@app.exception_handler(CareerNotFoundError)
+def career_not_found_handler(request: Request, exc: CareerNotFoundError):
+    """Map unknown target careers to 404"""
+    return JSONResponse(status_code=404, content={"detail": "Career not found"})
+
 @app.get("/")
 def root():
     """API health check"""
@@ -48,6 +77,7 @@ def root():
             "docs": "/docs",
             "parse_resume": "/parse-resume",
             "recommend": "/recommend-careers",
+            "career_details": "/career-details",
             "careers": "/careers"
         }
     }
@@ -55,9 +85,10 @@ def root():
 @app.get("/health")
 def health_check():
     """Detailed health check"""
+    careers = get_all_careers()
     return {
         "status": "healthy",
-        "careers_loaded": len(get_all_careers()),
+        "careers_loaded": len(careers),
         "api_version": "1.0.0"
     }
 
@@ -78,11 +109,11 @@ async def parse_resume(file: UploadFile = File(...)):
                 detail="Only PDF files are supported"
             )
         
-        # Read file
-        contents = await file.read()
-        
-        # Parse resume
-        result = ResumeParser.parse_full_resume(contents)
+        # Parse straight from the spooled upload instead of copying it into memory
+        await file.seek(0)
+        result = await asyncio.get_running_loop().run_in_executor(
+            _PARSE_POOL, ResumeParser.parse_full_resume_cached, file.file
+        )
         
         if not result.get("success"):
             return ResumeParseResponse(
@@ -136,13 +167,8 @@ def analyze_skills_gap(profile: StudentProfile, target_career: str):
     Returns detailed gap analysis with missing and matching skills
     """
     try:
-        analysis = recommender.analyze_skills_gap(profile, target_career)
-        
-        if "error" in analysis:
-            raise HTTPException(status_code=404, detail=analysis["error"])
-        
-        return analysis
-    except HTTPException:
+        return recommender.analyze_skills_gap(profile, target_career)
+    except CareerNotFoundError:
         raise
     except Exception as e:
         raise HTTPException(
@@ -166,7 +192,7 @@ def get_learning_path(profile: StudentProfile, target_career: str):
         if not path:
             raise HTTPException(
                 status_code=404,
-                detail="Career not found or no learning path needed"
+                detail="No learning path needed"
             )
         
         return {
@@ -175,7 +201,7 @@ def get_learning_path(profile: StudentProfile, target_career: str):
             "total_weeks": sum(item['estimated_weeks'] for item in path),
             "total_skills": len(path)
         }
-    except HTTPException:
+    except (HTTPException, CareerNotFoundError):
         raise
     except Exception as e:
         raise HTTPException(
@@ -183,12 +209,43 @@ def get_learning_path(profile: StudentProfile, target_career: str):
             detail=f"Error generating learning path: {str(e)}"
         )
 
+@app.post("/career-details")
+def get_career_plan(profile: StudentProfile, target_career: str):
+    """
+    Skills gap analysis and learning path for a target career in one call
+    
+    - **profile**: Student profile
+    - **target_career**: Name of target career
+    
+    Returns the gap analysis of /skills-gap-analysis and the learning path
+    (possibly empty) of /learning-path
+    """
+    try:
+        plan = recommender.get_career_plan(profile, target_career)
+        
+        path = plan["learning_path"]
+        return {
+            "target_career": target_career,
+            "skills_gap": plan["skills_gap"],
+            "learning_path": path,
+            "total_weeks": sum(item['estimated_weeks'] for item in path),
+            "total_skills": len(path)
+        }
+    except CareerNotFoundError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error generating career details: {str(e)}"
+        )
+
 @app.get("/careers")
 def list_careers():
     """Get list of all available careers"""
+    careers = get_all_careers()
     return {
-        "careers": get_all_careers(),
-        "total": len(get_all_careers())
+        "careers": careers,
+        "total": len(careers)
     }
 
 @app.get("/careers/{career_name}")
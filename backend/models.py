@@ -1,11 +1,13 @@
 """
 Pydantic models for request/response validation
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
 class StudentProfile(BaseModel):
     """Student profile input"""
+    model_config = ConfigDict(frozen=True)
+    
     skills: List[str] = Field(..., min_items=1, description="List of student's skills")
     interests: List[str] = Field(default=[], description="Areas of interest")
     education_level: str = Field(..., description="Current education level")
@@ -14,6 +16,8 @@ class StudentProfile(BaseModel):
 
 class CareerRecommendation(BaseModel):
     """Career recommendation output"""
+    model_config = ConfigDict(frozen=True)
+    
     career: str = Field(..., description="Career title")
     match_score: float = Field(..., ge=0, le=100, description="Match percentage")
     matching_skills: List[str] = Field(default=[], description="Skills that match")
@@ -24,6 +28,8 @@ class CareerRecommendation(BaseModel):
 
 class ResumeParseResponse(BaseModel):
     """Resume parsing response"""
+    model_config = ConfigDict(frozen=True)
+    
     status: str = Field(..., description="Success or error status")
     message: Optional[str] = Field(default=None, description="Error message if any")
     extracted_skills: List[str] = Field(default=[], description="Extracted skills")
@@ -34,6 +40,8 @@ class ResumeParseResponse(BaseModel):
 
 class SkillsGapAnalysis(BaseModel):
     """Skills gap analysis output"""
+    model_config = ConfigDict(frozen=True)
+    
     target_career: str
     current_skills: List[str]
     required_skills: List[str]
@@ -44,6 +52,8 @@ class SkillsGapAnalysis(BaseModel):
 
 class LearningResource(BaseModel):
     """Learning resource recommendation"""
+    model_config = ConfigDict(frozen=True)
+    
     skill: str
     resources: List[dict]
     estimated_time_weeks: int
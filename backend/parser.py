@@ -2,9 +2,60 @@
 Resume parsing and information extraction
 """
 import PyPDF2
+import hashlib
 import io
 import re
-from typing import List, Dict, Tuple
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import BinaryIO, List, Dict, Set, Tuple, Union
+
+try:
+    import ahocorasick
+except ImportError:  # Optional C extension; fall back to a str.find sweep per skill
+    ahocorasick = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # Optional PDFium backend; fall back to PyPDF2
+    pdfium = None
+
+# PDFium is not thread-safe; serialize access when parsing from worker threads
+_PDFIUM_LOCK = threading.Lock()
+
+# Parse results for recently seen uploads, keyed by content digest
+_PARSE_CACHE_SIZE = 256
+_PARSE_CACHE: "OrderedDict[bytes, Dict]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# Precompiled extraction patterns
+# All degree patterns fused into one alternation, one named group per degree
+_EDUCATION_RE = re.compile(
+    r'\b(?P<phd>phd|doctorate)\b'
+    r'|\b(?P<masters>master[\'s]*|m\.?s\.?|msc|m\.?tech)\b'
+    r'|\b(?P<mba>mba)\b'
+    r'|\b(?P<bachelors>bachelor[\'s]*|b\.?s\.?|bsc|b\.?tech|b\.?e\.?)\b'
+)
+
+_EDUCATION_DEGREES = {
+    "phd": "PhD",
+    "masters": "Master's",
+    "mba": "MBA",
+    "bachelors": "Bachelor's",
+}
+
+# Experience phrasings fused into one alternation; the trailing "experience"
+# is a lookahead so a following "experience: N years" can still match
+_EXPERIENCE_RE = re.compile(
+    r'(\d+)\+?\s*years?\s+(?:of\s+)?(?=experience)'
+    r'|experience[:\s]+(\d+)\+?\s*years?'
+    r'|(\d+)\+?\s*years?\s+(?:in|as)'
+)
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'[\+]?[(]?[0-9]{3}[)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4,6}')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+')
+_GITHUB_RE = re.compile(r'github\.com/[\w-]+')
 
 class ResumeParser:
     """Parse resume and extract key information"""
@@ -51,25 +102,43 @@ class ResumeParser:
         ]
     }
     
+    # Reverse lookup: skill -> category
+    SKILL_TO_CATEGORY = {
+        skill: category
+        for category, skills_list in SKILLS_DATABASE.items()
+        for skill in skills_list
+    }
+    
     @staticmethod
-    def get_all_skills() -> List[str]:
-        """Get flattened list of all skills"""
+    @lru_cache(maxsize=1)
+    def get_all_skills() -> Tuple[str, ...]:
+        """Get flattened list of all skills (computed once)"""
         all_skills = []
         for category in ResumeParser.SKILLS_DATABASE.values():
             all_skills.extend(category)
-        return all_skills
+        return tuple(all_skills)
     
     @staticmethod
-    def extract_text_from_pdf(file_bytes: bytes) -> str:
-        """Extract text from PDF with error handling"""
+    def extract_text_from_pdf(pdf_file: Union[bytes, BinaryIO]) -> str:
+        """Extract text from PDF (raw bytes or binary file object) with error handling"""
         try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_bytes))
-            text = ""
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            return text.strip()
+            if isinstance(pdf_file, (bytes, bytearray)):
+                pdf_file = io.BytesIO(pdf_file)
+            
+            if pdfium is not None:
+                with _PDFIUM_LOCK:
+                    pdf = pdfium.PdfDocument(pdf_file)
+                    try:
+                        pages = [page.get_textpage().get_text_range() for page in pdf]
+                    finally:
+                        pdf.close()
+            else:
+                pdf_reader = PyPDF2.PdfReader(pdf_file)
+                pages = [page.extract_text() for page in pdf_reader.pages]
+            
+            # PDFium separates lines with CRLF; normalize to match PyPDF2
+            text = "\n".join(page_text for page_text in pages if page_text)
+            return text.replace("\r\n", "\n").strip()
         except Exception as e:
             print(f"Error extracting PDF text: {e}")
             return ""
@@ -84,82 +153,50 @@ class ResumeParser:
             return [], {}
         
         text_lower = text.lower()
-        found_skills = []
+        unique_skills = []
         skills_by_category = {}
-        
-        all_skills = ResumeParser.get_all_skills()
-        
-        for skill in all_skills:
-            skill_lower = skill.lower()
-            
-            # Check for exact match with word boundaries
-            pattern = r'\b' + re.escape(skill_lower) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill)
-                
+        seen_lower = set()
+
+        # Find every vocabulary skill mentioned in the text
+        matched = _scan_skills(text_lower)
+
+        for skill in ResumeParser.get_all_skills():
+            if skill in matched:
+                # Skip case-insensitive duplicates while preserving order
+                skill_lower = skill.lower()
+                if skill_lower not in seen_lower:
+                    seen_lower.add(skill_lower)
+                    unique_skills.append(skill)
+
                 # Categorize skill
-                for category, skills_list in ResumeParser.SKILLS_DATABASE.items():
-                    if skill in skills_list:
-                        if category not in skills_by_category:
-                            skills_by_category[category] = []
-                        skills_by_category[category].append(skill)
-                        break
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_skills = []
-        for skill in found_skills:
-            if skill.lower() not in seen:
-                seen.add(skill.lower())
-                unique_skills.append(skill)
-        
+                category = ResumeParser.SKILL_TO_CATEGORY[skill]
+                skills_by_category.setdefault(category, []).append(skill)
+
         return unique_skills, skills_by_category
     
     @staticmethod
     def extract_education(text: str) -> List[str]:
         """Extract education information"""
-        education_patterns = {
-            r'\bphd\b': "PhD",
-            r'\bdoctorate\b': "PhD",
-            r'\bmaster[\'s]*\b': "Master's",
-            r'\bm\.?s\.?\b': "Master's",
-            r'\bmsc\b': "Master's",
-            r'\bm\.?tech\b': "Master's",
-            r'\bmba\b': "MBA",
-            r'\bbachelor[\'s]*\b': "Bachelor's",
-            r'\bb\.?s\.?\b': "Bachelor's",
-            r'\bbsc\b': "Bachelor's",
-            r'\bb\.?tech\b': "Bachelor's",
-            r'\bb\.?e\.?\b': "Bachelor's",
-        }
-        
         text_lower = text.lower()
-        education = set()
-        
-        for pattern, degree in education_patterns.items():
-            if re.search(pattern, text_lower):
-                education.add(degree)
+        education = {
+            _EDUCATION_DEGREES[match.lastgroup]
+            for match in _EDUCATION_RE.finditer(text_lower)
+        }
         
         return sorted(list(education))
     
     @staticmethod
     def extract_experience_years(text: str) -> int:
         """Estimate years of experience from resume"""
-        patterns = [
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-            r'experience[:\s]+(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s+(?:in|as)',
-        ]
-        
         text_lower = text.lower()
-        years = []
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                years.append(int(match.group(1)))
+        years = [
+            int(group)
+            for match in _EXPERIENCE_RE.finditer(text_lower)
+            for group in match.groups()
+            if group
+        ]
         
-        return max(years) if years else 0
+        return max(years, default=0)
     
     @staticmethod
     def extract_contact_info(text: str) -> Dict[str, str]:
@@ -167,37 +204,33 @@ class ResumeParser:
         contact = {}
         
         # Email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
+        email_match = _EMAIL_RE.search(text)
         if email_match:
             contact['email'] = email_match.group(0)
         
         # Phone
-        phone_pattern = r'[\+]?[(]?[0-9]{3}[)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4,6}'
-        phone_match = re.search(phone_pattern, text)
+        phone_match = _PHONE_RE.search(text)
         if phone_match:
             contact['phone'] = phone_match.group(0)
         
         # LinkedIn
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin_match = re.search(linkedin_pattern, text.lower())
+        linkedin_match = _LINKEDIN_RE.search(text.lower())
         if linkedin_match:
             contact['linkedin'] = linkedin_match.group(0)
         
         # GitHub
-        github_pattern = r'github\.com/[\w-]+'
-        github_match = re.search(github_pattern, text.lower())
+        github_match = _GITHUB_RE.search(text.lower())
         if github_match:
             contact['github'] = github_match.group(0)
         
         return contact
     
     @staticmethod
-    def parse_full_resume(file_bytes: bytes) -> Dict:
+    def parse_full_resume(pdf_file: Union[bytes, BinaryIO]) -> Dict:
         """
         Complete resume parsing with all information extraction
         """
-        text = ResumeParser.extract_text_from_pdf(file_bytes)
+        text = ResumeParser.extract_text_from_pdf(pdf_file)
         
         if not text or len(text.strip()) < 50:
             return {
@@ -219,4 +252,89 @@ class ResumeParser:
             "experience_years": experience_years,
             "contact": contact,
             "text_preview": text[:500]
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def parse_full_resume_cached(pdf_file: Union[bytes, BinaryIO]) -> Dict:
+        """
+        Parse a resume, reusing the result for previously seen file contents
+        """
+        digest = _digest_pdf(pdf_file)
+    
+        with _PARSE_CACHE_LOCK:
+            result = _PARSE_CACHE.get(digest)
+            if result is not None:
+                _PARSE_CACHE.move_to_end(digest)
+                return result
+    
+        result = ResumeParser.parse_full_resume(pdf_file)
+    
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[digest] = result
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+    
+        return result
+
+
+def _digest_pdf(pdf_file: Union[bytes, BinaryIO]) -> bytes:
+    """BLAKE2b digest of the PDF contents, rewinding file objects afterwards"""
+    hasher = hashlib.blake2b(digest_size=16)
+    if isinstance(pdf_file, (bytes, bytearray)):
+        hasher.update(pdf_file)
+    else:
+        for chunk in iter(lambda: pdf_file.read(1 << 16), b""):
+            hasher.update(chunk)
+        pdf_file.seek(0)
+    return hasher.digest()
+
+
+# Skill matchers, built once at import time from the skills vocabulary
+_WORD_CHAR_RE = re.compile(r'\w')
+
+_SKILL_BY_LOWER = {skill.lower(): skill for skill in ResumeParser.get_all_skills()}
+
+
+def _build_skill_automaton():
+    """Build an Aho-Corasick automaton over the lowercased vocabulary"""
+    automaton = ahocorasick.Automaton()
+    for skill_lower, skill in _SKILL_BY_LOWER.items():
+        automaton.add_word(skill_lower, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AUTOMATON = _build_skill_automaton() if ahocorasick is not None else None
+
+
+def _is_whole_word(text_lower: str, start: int, end: int) -> bool:
+    """
+    Check that text_lower[start:end] is not embedded in a longer word.
+    Only word-character edges need a boundary, so "c++17" still holds "c++".
+    """
+    if (start > 0 and _WORD_CHAR_RE.match(text_lower, start)
+            and _WORD_CHAR_RE.match(text_lower, start - 1)):
+        return False
+    return not (_WORD_CHAR_RE.match(text_lower, end - 1)
+                and _WORD_CHAR_RE.match(text_lower, end))
+
+
+def _scan_skills(text_lower: str) -> Set[str]:
+    """Return the canonical names of all skills mentioned in the lowercased text"""
+    matched = set()
+    
+    if _SKILL_AUTOMATON is not None:
+        for end, skill in _SKILL_AUTOMATON.iter(text_lower):
+            if _is_whole_word(text_lower, end - len(skill) + 1, end + 1):
+                matched.add(skill)
+        return matched
+    
+    # Fallback: C-level substring search per skill, boundaries checked on hits only
+    for skill_lower, skill in _SKILL_BY_LOWER.items():
+        start = text_lower.find(skill_lower)
+        while start != -1:
+            if _is_whole_word(text_lower, start, start + len(skill_lower)):
+                matched.add(skill)
+                break
+            start = text_lower.find(skill_lower, start + 1)
+    return matched
@@ -2,11 +2,75 @@
 Career recommendation engine using ML algorithms
 """
 import numpy as np
-from typing import List, Dict
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import List, Dict, FrozenSet, Iterator, Mapping, Set, Tuple
 from sklearn.metrics.pairwise import cosine_similarity
-from backend.database import CAREER_DATABASE
+from backend.database import (
+    CAREER_RECORDS,
+    CAREER_SKILL_SETS,
+    CareerRecord,
+    normalize_skill
+)
 from backend.models import CareerRecommendation, StudentProfile
 
+class CareerNotFoundError(KeyError):
+    """Raised when a target career is not in the career database"""
+
+@lru_cache(maxsize=1)
+def _compile_career_index():
+    """
+    Build the per-career lookups and skill incidence matrices from the
+    career database (computed once, shared by all recommender instances)
+    """
+    # Lowercased lookups per career, built once instead of on every request
+    career_index = {
+        career: {
+            "required_lower_map": {normalize_skill(s): s for s in details.required_skills},
+            "nice_lower_map": {normalize_skill(s): s for s in details.nice_to_have},
+            "name_lower": normalize_skill(career),
+            "industry_lower": tuple(normalize_skill(i) for i in details.industry)
+        }
+        for career, details in CAREER_RECORDS.items()
+    }
+    
+    # Career x skill incidence matrices (required / nice-to-have) for
+    # scoring every career against a user in one vectorized step
+    skill_vocab: Dict[str, int] = {}
+    for details in CAREER_RECORDS.values():
+        for s in details.required_skills + details.nice_to_have:
+            skill_vocab.setdefault(normalize_skill(s), len(skill_vocab))
+    
+    shape = (len(CAREER_RECORDS), len(skill_vocab))
+    R = np.zeros(shape, dtype=np.uint8)
+    N = np.zeros(shape, dtype=np.uint8)
+    for row, career in enumerate(CAREER_RECORDS):
+        skill_sets = CAREER_SKILL_SETS[career]
+        R[row, [skill_vocab[s] for s in skill_sets['required']]] = 1
+        N[row, [skill_vocab[s] for s in skill_sets['nice_to_have']]] = 1
+    req_counts = R.sum(axis=1)
+    nice_counts = N.sum(axis=1)
+    
+    # Bit-packed rows: match counts become AND + popcount over 64-skill words
+    R_bits = _pack_skill_bits(R)
+    N_bits = _pack_skill_bits(N)
+    
+    # Shared between instances, so guard the arrays against in-place writes
+    for array in (R_bits, N_bits, req_counts, nice_counts):
+        array.flags.writeable = False
+    
+    return career_index, skill_vocab, R_bits, N_bits, req_counts, nice_counts
+
+def _pack_skill_bits(presence: np.ndarray) -> np.ndarray:
+    """
+    Pack 0/1 skill presence rows (last axis = skill vocabulary) into uint64
+    words, zero-padding the vocabulary to a multiple of 64 skills
+    """
+    padding = -presence.shape[-1] % 64
+    padded = np.pad(presence, [(0, 0)] * (presence.ndim - 1) + [(0, padding)])
+    return np.ascontiguousarray(np.packbits(padded, axis=-1)).view(np.uint64)
+
 class CareerRecommender:
     """
     Recommendation engine that uses multiple algorithms:
@@ -16,7 +80,17 @@ class CareerRecommender:
     """
     
     def __init__(self):
-        self.career_db = CAREER_DATABASE
+        self.career_db = CAREER_RECORDS
+        
+        # Lowercased lookups and incidence matrices, compiled once per process
+        (
+            self._career_index,
+            self.skill_vocab,
+            self.R_bits,
+            self.N_bits,
+            self.req_counts,
+            self.nice_counts
+        ) = _compile_career_index()
     
     def calculate_skill_match_score(
         self, 
@@ -32,16 +106,30 @@ class CareerRecommender:
         if not career_skills:
             return 0.0
         
-        user_skills_lower = {s.lower() for s in user_skills}
-        required_lower = {s.lower() for s in career_skills}
-        nice_lower = {s.lower() for s in nice_to_have}
+        return self._skill_match_score(
+            {normalize_skill(s) for s in user_skills},
+            frozenset(normalize_skill(s) for s in career_skills),
+            frozenset(normalize_skill(s) for s in nice_to_have)
+        )
+    
+    def _skill_match_score(
+        self,
+        user_skills_lower: Set[str],
+        required_lower: FrozenSet[str],
+        nice_lower: FrozenSet[str]
+    ) -> float:
+        """
+        Weighted skill match on already-lowercased skill sets
+        """
+        if not required_lower:
+            return 0.0
         
         # Required skills matching
         required_matches = len(user_skills_lower & required_lower)
         required_score = (required_matches / len(required_lower)) * 70
         
         # Nice-to-have skills matching
-        if nice_to_have:
+        if nice_lower:
             nice_matches = len(user_skills_lower & nice_lower)
             nice_score = (nice_matches / len(nice_lower)) * 30
         else:
@@ -50,11 +138,42 @@ class CareerRecommender:
         total_score = required_score + nice_score
         return round(total_score, 2)
     
+    def _skill_match_scores(self, user_skills_lower: Set[str]) -> List[float]:
+        """
+        Weighted skill match of the user against every career, in career order
+        """
+        u = np.zeros(len(self.skill_vocab), dtype=np.uint8)
+        for skill in user_skills_lower:
+            column = self.skill_vocab.get(skill)
+            if column is not None:
+                u[column] = 1
+        u_bits = _pack_skill_bits(u)
+        
+        required_matches = np.bitwise_count(self.R_bits & u_bits).sum(axis=1)
+        nice_matches = np.bitwise_count(self.N_bits & u_bits).sum(axis=1)
+        
+        required_ratio = np.divide(
+            required_matches, self.req_counts,
+            out=np.zeros(len(self.req_counts)), where=self.req_counts > 0
+        )
+        nice_ratio = np.divide(
+            nice_matches, self.nice_counts,
+            out=np.zeros(len(self.nice_counts)), where=self.nice_counts > 0
+        )
+        
+        # Careers without required skills score 0, as in _skill_match_score
+        scores = np.where(
+            self.req_counts > 0, required_ratio * 70 + nice_ratio * 30, 0.0
+        )
+        
+        # Python's round() to match the per-career scores exactly
+        return [round(score, 2) for score in scores.tolist()]
+    
     def calculate_interest_boost(
         self, 
         interests: List[str], 
         career_name: str,
-        career_details: Dict
+        career_details: CareerRecord
     ) -> float:
         """
         Boost score if user's interests align with career
@@ -62,9 +181,22 @@ class CareerRecommender:
         if not interests:
             return 0
         
+        return self._interest_boost(
+            [normalize_skill(i) for i in interests],
+            normalize_skill(career_name),
+            tuple(normalize_skill(i) for i in career_details.industry)
+        )
+    
+    def _interest_boost(
+        self,
+        interests_lower: List[str],
+        career_lower: str,
+        industry_lower: Tuple[str, ...]
+    ) -> float:
+        """
+        Interest boost on already-lowercased interests, name and industries
+        """
         boost = 0
-        interests_lower = [i.lower() for i in interests]
-        career_lower = career_name.lower()
         
         # Check if interest matches career name or industry
         for interest in interests_lower:
@@ -72,17 +204,20 @@ class CareerRecommender:
                 boost += 5
             
             # Check industry match
-            if 'industry' in career_details:
-                for industry in career_details['industry']:
-                    if interest in industry.lower():
-                        boost += 3
+            for industry in industry_lower:
+                if interest in industry:
+                    boost += 3
+            
+            # Already at the cap; remaining interests cannot change the result
+            if boost >= 10:
+                return 10
         
-        return min(boost, 10)  # Cap at 10% boost
+        return boost
     
     def calculate_experience_match(
         self,
         user_experience: int,
-        career_details: Dict
+        career_details: CareerRecord
     ) -> float:
         """
         Adjust score based on experience level
@@ -106,22 +241,24 @@ class CareerRecommender:
         """
         Generate personalized career recommendations
         """
-        recommendations = []
+        user_skills_lower = {normalize_skill(s) for s in profile.skills}
+        interests_lower = [normalize_skill(i) for i in profile.interests]
+        careers = list(self.career_db.items())
         
-        for career, details in self.career_db.items():
-            # Base skill matching
-            skill_score = self.calculate_skill_match_score(
-                profile.skills,
-                details['required_skills'],
-                details['nice_to_have']
-            )
-            
-            # Interest boost
-            interest_boost = self.calculate_interest_boost(
-                profile.interests,
-                career,
-                details
-            )
+        # Base skill matching for all careers at once
+        skill_scores = self._skill_match_scores(user_skills_lower)
+        
+        final_scores = []
+        for skill_score, (career, details) in zip(skill_scores, careers):
+            # Interest boost (no interests means no boost for any career)
+            interest_boost = 0
+            if interests_lower:
+                index = self._career_index[career]
+                interest_boost = self._interest_boost(
+                    interests_lower,
+                    index['name_lower'],
+                    index['industry_lower']
+                )
             
             # Experience match
             experience_boost = self.calculate_experience_match(
@@ -130,41 +267,71 @@ class CareerRecommender:
             )
             
             # Final score
-            final_score = min(skill_score + interest_boost + experience_boost, 100)
+            final_scores.append(
+                min(skill_score + interest_boost + experience_boost, 100)
+            )
+        
+        # Build recommendations only for the top N careers
+        recommendations = []
+        for i in self._top_n_indices(final_scores, top_n):
+            career, details = careers[i]
             
             # Identify matching and missing skills
-            user_skills_lower = {s.lower() for s in profile.skills}
-            required_lower = {s.lower(): s for s in details['required_skills']}
+            required_lower = self._career_index[career]['required_lower_map']
             
             matching_skills = [
-                required_lower[skill] 
-                for skill in user_skills_lower 
-                if skill in required_lower
+                skill
+                for skill_lower, skill in required_lower.items()
+                if skill_lower in user_skills_lower
             ]
             
-            skills_to_learn = [
-                skill 
-                for skill in details['required_skills']
-                if skill.lower() not in user_skills_lower
-            ]
+            # Top 5 priority skills, in the career's required order
+            skills_to_learn = list(islice(
+                (
+                    skill
+                    for skill_lower, skill in required_lower.items()
+                    if skill_lower not in user_skills_lower
+                ),
+                5
+            ))
             
-            # Create recommendation
+            # Create recommendation; fields come from trusted internal data,
+            # so skip validation (match_score is cast as validation would)
             recommendations.append(
-                CareerRecommendation(
+                CareerRecommendation.model_construct(
                     career=career,
-                    match_score=final_score,
+                    match_score=float(final_scores[i]),
                     matching_skills=matching_skills,
-                    skills_to_learn=skills_to_learn[:5],  # Top 5 priority skills
-                    description=details['description'],
-                    salary_info=details['avg_salary'],
-                    growth_outlook=details['growth_outlook']
+                    skills_to_learn=skills_to_learn,
+                    description=details.description,
+                    salary_info=details.avg_salary,
+                    growth_outlook=details.growth_outlook
                 )
             )
         
-        # Sort by match score
-        recommendations.sort(key=lambda x: x.match_score, reverse=True)
+        return recommendations
+    
+    @staticmethod
+    def _top_n_indices(scores: List[float], top_n: int) -> List[int]:
+        """
+        Indices of the top_n highest scores, best first, ties in input order
+        """
+        k = min(top_n, len(scores))
+        if k <= 0:
+            return []
+        
+        neg_scores = -np.asarray(scores, dtype=float)
+        if k < len(scores):
+            # Partial selection around the k-th best score instead of a full
+            # sort; boundary ties go to the earliest careers, as a stable sort would
+            kth = np.partition(neg_scores, k - 1)[k - 1]
+            above = np.flatnonzero(neg_scores < kth)
+            ties = np.flatnonzero(neg_scores == kth)[:k - len(above)]
+            top = np.concatenate([above, ties])
+        else:
+            top = np.arange(len(scores))
         
-        return recommendations[:top_n]
+        return top[np.lexsort((top, neg_scores[top]))].tolist()
     
     def analyze_skills_gap(
         self,
@@ -175,40 +342,32 @@ class CareerRecommender:
         Detailed skills gap analysis for a target career
         """
         if target_career not in self.career_db:
-            return {"error": "Career not found"}
+            raise CareerNotFoundError(target_career)
         
         career_details = self.career_db[target_career]
-        user_skills_lower = {s.lower() for s in profile.skills}
+        user_skills_lower = {normalize_skill(s) for s in profile.skills}
         
-        required_skills = career_details['required_skills']
-        nice_to_have = career_details['nice_to_have']
+        required_skills = career_details.required_skills
+        nice_to_have = career_details.nice_to_have
         
         # Categorize skills
-        required_lower = {s.lower(): s for s in required_skills}
-        nice_lower = {s.lower(): s for s in nice_to_have}
+        index = self._career_index[target_career]
+        required_lower = index['required_lower_map']
+        nice_lower = index['nice_lower_map']
         
-        missing_required = [
-            required_lower[skill]
-            for skill in required_lower
-            if skill not in user_skills_lower
-        ]
-        
-        missing_nice = [
-            nice_lower[skill]
-            for skill in nice_lower
-            if skill not in user_skills_lower
-        ]
+        missing_required = list(self._missing_skills(required_lower, user_skills_lower))
+        missing_nice = list(self._missing_skills(nice_lower, user_skills_lower))
         
         matching_required = [
-            required_lower[skill]
-            for skill in user_skills_lower
-            if skill in required_lower
+            skill
+            for skill_lower, skill in required_lower.items()
+            if skill_lower in user_skills_lower
         ]
         
         matching_nice = [
-            nice_lower[skill]
-            for skill in user_skills_lower
-            if skill in nice_lower
+            skill
+            for skill_lower, skill in nice_lower.items()
+            if skill_lower in user_skills_lower
         ]
         
         # Calculate completion percentage
@@ -230,6 +389,37 @@ class CareerRecommender:
             "priority_skills": priority_skills
         }
     
+    @staticmethod
+    def _missing_skills(
+        skill_lower_map: Dict[str, str],
+        user_skills_lower: Set[str]
+    ) -> Iterator[str]:
+        """
+        Career skills (original casing, career order) the user does not have
+        """
+        return (
+            skill
+            for skill_lower, skill in skill_lower_map.items()
+            if skill_lower not in user_skills_lower
+        )
+    
+    def _priority_skills(
+        self,
+        profile: StudentProfile,
+        target_career: str
+    ) -> List[str]:
+        """
+        Priority skills of the gap analysis (first 3 missing required,
+        first 2 missing nice-to-have) without the rest of the analysis
+        """
+        user_skills_lower = {normalize_skill(s) for s in profile.skills}
+        index = self._career_index[target_career]
+        
+        return (
+            list(islice(self._missing_skills(index['required_lower_map'], user_skills_lower), 3))
+            + list(islice(self._missing_skills(index['nice_lower_map'], user_skills_lower), 2))
+        )
+    
     def get_learning_path(
         self,
         profile: StudentProfile,
@@ -238,11 +428,33 @@ class CareerRecommender:
         """
         Generate a structured learning path with timeline
         """
-        gap_analysis = self.analyze_skills_gap(profile, target_career)
+        if target_career not in self.career_db:
+            raise CareerNotFoundError(target_career)
         
-        if "error" in gap_analysis:
-            return []
+        return self._build_learning_path(
+            self._priority_skills(profile, target_career)
+        )
+    
+    def get_career_plan(
+        self,
+        profile: StudentProfile,
+        target_career: str
+    ) -> Dict:
+        """
+        Skills gap analysis and learning path for a target career,
+        sharing a single gap computation
+        """
+        gap_analysis = self.analyze_skills_gap(profile, target_career)
         
+        return {
+            "skills_gap": gap_analysis,
+            "learning_path": self._build_learning_path(gap_analysis['priority_skills'])
+        }
+    
+    def _build_learning_path(self, priority_skills: List[str]) -> List[Dict]:
+        """
+        Learning modules with difficulty and timeline for the priority skills
+        """
         learning_path = []
         
         # Estimate learning time for each skill (in weeks)
@@ -253,7 +465,7 @@ class CareerRecommender:
         }
         
         # Create learning modules
-        for idx, skill in enumerate(gap_analysis['priority_skills'], 1):
+        for idx, skill in enumerate(priority_skills, 1):
             # Simplified difficulty estimation
             difficulty = "intermediate"
             if skill in ["Python", "JavaScript", "HTML", "CSS", "Git"]:
@@ -271,12 +483,14 @@ class CareerRecommender:
         
         return learning_path
     
-    def _get_learning_resources(self, skill: str) -> List[Dict]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_learning_resources(skill: str) -> Tuple[Mapping[str, str], ...]:
         """
-        Get learning resources for a skill
+        Get learning resources for a skill (memoized, read-only)
         In production, this would query a real database
         """
-        resources = [
+        resources = (
             {
                 "type": "Course",
                 "name": f"{skill} Complete Course",
@@ -295,6 +509,6 @@ class CareerRecommender:
                 "platform": "LeetCode/HackerRank",
                 "url": "https://leetcode.com"
             }
-        ]
+        )
         
-        return resources
\ No newline at end of file
+        return tuple(MappingProxyType(resource) for resource in resources)
\ No newline at end of file
@@ -9,11 +9,12 @@ from pathlib import Path
 # Add frontend to path
 sys.path.append(str(Path(__file__).parent))
 
+from components.api_client import get_api_session
 from components.sidebar import render_sidebar
 from components.visualizations import (
     create_radar_chart,
-    create_skills_gap_chart,
-    create_timeline_chart
+    create_timeline_chart,
+    render_skills_gap
 )
 from components.career_cards import render_career_card
 
@@ -56,6 +57,8 @@ def initialize_session_state():
     """Initialize session state variables"""
     if 'extracted_skills' not in st.session_state:
         st.session_state['extracted_skills'] = []
+    if 'extracted_skills_text' not in st.session_state:
+        st.session_state['extracted_skills_text'] = ""
     if 'resume_parsed' not in st.session_state:
         st.session_state['resume_parsed'] = False
     if 'education' not in st.session_state:
@@ -65,14 +68,74 @@ def initialize_session_state():
     if 'recommendations' not in st.session_state:
         st.session_state['recommendations'] = None
 
+@st.cache_data(ttl=30, show_spinner=False)
+def probe_backend():
+    """GET /health; raises unless healthy, so only an "up" result is cached"""
+    response = get_api_session().get(f"{API_URL}/health", timeout=2)
+    if response.status_code != 200:
+        raise requests.HTTPError(f"Health check returned {response.status_code}")
+    return True
+
 def check_backend_status():
-    """Check if backend is running"""
+    """Check if backend is running (a healthy result is reused for 30s)"""
     try:
-        response = requests.get(f"{API_URL}/health", timeout=2)
-        return response.status_code == 200
+        return probe_backend()
     except:
         return False
 
+def profile_cache_key(profile):
+    """Hashable key for a profile, ignoring skill/interest order and case"""
+    return (
+        tuple(sorted(s.casefold() for s in profile.get('skills', []))),
+        tuple(sorted(i.casefold() for i in profile.get('interests', []))),
+        profile.get('education_level'),
+        round(profile.get('gpa') or 0.0, 2),
+        profile.get('experience_years')
+    )
+
+# Cached API calls: identical profiles are answered without a backend round trip.
+# Underscore-prefixed arguments are not hashed by Streamlit; the key stands in.
+# Non-200 responses raise requests.HTTPError so they are never cached.
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_recommendations(profile_key, _profile):
+    """POST /recommend-careers for a profile; returns (recommendations, summary)"""
+    response = get_api_session().post(f"{API_URL}/recommend-careers", json=_profile)
+    response.raise_for_status()
+    recommendations = response.json()
+    return recommendations, summarize_recommendations(recommendations)
+
+def summarize_recommendations(recommendations):
+    """Header metrics for a recommendation list, computed once per response"""
+    top = recommendations[0]
+    top3 = recommendations[:3]
+    return {
+        "top_career": top['career'],
+        "top_score": top['match_score'],
+        "avg_top3": sum(r['match_score'] for r in top3) / len(top3),
+        "skills_to_learn_count": len(top['skills_to_learn'])
+    }
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_career_details(profile_key, target_career, _profile):
+    """POST /career-details: skills gap and learning path in one round trip"""
+    response = get_api_session().post(
+        f"{API_URL}/career-details",
+        params={"target_career": target_career},
+        json=_profile
+    )
+    response.raise_for_status()
+    return response.json()
+
+def current_profile():
+    """Profile last submitted for recommendations, from session state"""
+    return {
+        "skills": st.session_state.get('current_skills', []),
+        "interests": st.session_state.get('current_interests', []),
+        "education_level": st.session_state.get('education_level', "Bachelor's"),
+        "gpa": st.session_state.get('gpa', 3.5),
+        "experience_years": st.session_state.get('experience_years', 0)
+    }
+
 def render_welcome_screen():
     """Render welcome/intro screen"""
     st.markdown("""
@@ -106,7 +169,7 @@ def render_welcome_screen():
     # Show sample careers
     with st.expander("📋 View Available Career Paths"):
         try:
-            response = requests.get(f"{API_URL}/careers")
+            response = get_api_session().get(f"{API_URL}/careers")
             if response.status_code == 200:
                 careers = response.json()['careers']
                 cols = st.columns(3)
@@ -116,21 +179,20 @@ def render_welcome_screen():
         except:
             st.warning("Could not load careers. Make sure backend is running.")
 
-def render_recommendations(recommendations):
+def render_recommendations(recommendations, summary):
     """Render career recommendations"""
     st.success("✨ Analysis Complete!")
     
     # Top metrics
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Top Match", recommendations[0]['career'])
+        st.metric("Top Match", summary['top_career'])
     with col2:
-        st.metric("Match Score", f"{recommendations[0]['match_score']}%")
+        st.metric("Match Score", f"{summary['top_score']}%")
     with col3:
-        st.metric("Skills to Learn", len(recommendations[0]['skills_to_learn']))
+        st.metric("Skills to Learn", summary['skills_to_learn_count'])
     with col4:
-        avg_match = sum(r['match_score'] for r in recommendations[:3]) / 3
-        st.metric("Avg Top 3", f"{avg_match:.1f}%")
+        st.metric("Avg Top 3", f"{summary['avg_top3']:.1f}%")
     
     st.divider()
     
@@ -174,70 +236,58 @@ def render_skills_analysis_tab(recommendations):
     )
     
     # Get profile from session state
-    profile = {
-        "skills": st.session_state.get('current_skills', []),
-        "interests": st.session_state.get('current_interests', []),
-        "education_level": st.session_state.get('education_level', "Bachelor's"),
-        "gpa": st.session_state.get('gpa', 3.5),
-        "experience_years": st.session_state.get('experience_years', 0)
-    }
+    profile = current_profile()
     
-    # Get skills gap analysis
+    # Get skills gap analysis (shared with the learning path tab's request)
     try:
-        response = requests.post(
-            f"{API_URL}/skills-gap-analysis",
-            params={"target_career": selected_career},
-            json=profile
-        )
+        gap_data = fetch_career_details(
+            profile_cache_key(profile), selected_career, profile
+        )['skills_gap']
         
-        if response.status_code == 200:
-            gap_data = response.json()
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric(
-                    "Completion",
-                    f"{gap_data['completion_percentage']}%"
-                )
-            with col2:
-                st.metric(
-                    "Skills Gap",
-                    len(gap_data.get('missing_required', []))
-                )
-            with col3:
-                st.metric(
-                    "Bonus Skills",
-                    len(gap_data.get('matching_nice', []))
-                )
-            
-            # Skills breakdown
-            col_left, col_right = st.columns(2)
-            
-            with col_left:
-                st.subheader("✅ Your Matching Skills")
-                matching = gap_data.get('matching_required', [])
-                if matching:
-                    for skill in matching:
-                        st.success(f"✓ {skill}")
-                else:
-                    st.info("No matching required skills yet")
-            
-            with col_right:
-                st.subheader("📚 Skills to Learn")
-                missing = gap_data.get('missing_required', [])
-                if missing:
-                    for skill in missing:
-                        st.warning(f"→ {skill}")
-                else:
-                    st.success("You have all required skills!")
-            
-            # Visualization
-            if missing or matching:
-                st.plotly_chart(
-                    create_skills_gap_chart(matching, missing),
-                    use_container_width=True
-                )
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric(
+                "Completion",
+                f"{gap_data['completion_percentage']}%"
+            )
+        with col2:
+            st.metric(
+                "Skills Gap",
+                len(gap_data.get('missing_required', []))
+            )
+        with col3:
+            st.metric(
+                "Bonus Skills",
+                len(gap_data.get('matching_nice', []))
+            )
+        
+        # Skills breakdown
+        col_left, col_right = st.columns(2)
+        
+        with col_left:
+            st.subheader("✅ Your Matching Skills")
+            matching = gap_data.get('matching_required', [])
+            if matching:
+                for skill in matching:
+                    st.success(f"✓ {skill}")
+            else:
+                st.info("No matching required skills yet")
+        
+        with col_right:
+            st.subheader("📚 Skills to Learn")
+            missing = gap_data.get('missing_required', [])
+            if missing:
+                for skill in missing:
+                    st.warning(f"→ {skill}")
+            else:
+                st.success("You have all required skills!")
+        
+        # Visualization
+        if missing or matching:
+            render_skills_gap(matching, missing)
+    except requests.HTTPError:
+        pass  # Unsuccessful response: nothing to show
     except Exception as e:
         st.error(f"Error loading skills analysis: {str(e)}")
 
@@ -255,51 +305,45 @@ def render_learning_path_tab():
             key="learning_path_career"
         )
         
-        profile = {
-            "skills": st.session_state.get('current_skills', []),
-            "interests": st.session_state.get('current_interests', []),
-            "education_level": st.session_state.get('education_level', "Bachelor's"),
-            "gpa": st.session_state.get('gpa', 3.5)
-        }
+        profile = current_profile()
         
         try:
-            response = requests.post(
-                f"{API_URL}/learning-path",
-                params={"target_career": selected_career},
-                json=profile
+            data = fetch_career_details(
+                profile_cache_key(profile), selected_career, profile
             )
+            path = data['learning_path']
+            if not path:
+                return  # No learning path needed
             
-            if response.status_code == 200:
-                data = response.json()
-                path = data['learning_path']
-                
-                # Summary metrics
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Total Skills", data['total_skills'])
-                with col2:
-                    st.metric("Est. Duration", f"{data['total_weeks']} weeks")
-                with col3:
-                    st.metric("Target", selected_career)
-                
-                # Timeline
-                st.plotly_chart(
-                    create_timeline_chart(path),
-                    use_container_width=True
-                )
-                
-                # Detailed learning modules
-                st.subheader("📖 Detailed Learning Plan")
-                for module in path:
-                    with st.expander(
-                        f"Module {module['order']}: {module['skill']} "
-                        f"({module['estimated_weeks']} weeks - {module['difficulty'].title()})"
-                    ):
-                        st.write(f"**Difficulty:** {module['difficulty'].title()}")
-                        st.write(f"**Time Commitment:** {module['estimated_weeks']} weeks")
-                        st.write("\n**Recommended Resources:**")
-                        for resource in module['resources']:
-                            st.write(f"- [{resource['name']}]({resource['url']}) ({resource['platform']})")
+            # Summary metrics
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Skills", data['total_skills'])
+            with col2:
+                st.metric("Est. Duration", f"{data['total_weeks']} weeks")
+            with col3:
+                st.metric("Target", selected_career)
+            
+            # Timeline
+            st.plotly_chart(
+                create_timeline_chart(path),
+                use_container_width=True
+            )
+            
+            # Detailed learning modules
+            st.subheader("📖 Detailed Learning Plan")
+            for module in path:
+                with st.expander(
+                    f"Module {module['order']}: {module['skill']} "
+                    f"({module['estimated_weeks']} weeks - {module['difficulty'].title()})"
+                ):
+                    st.write(f"**Difficulty:** {module['difficulty'].title()}")
+                    st.write(f"**Time Commitment:** {module['estimated_weeks']} weeks")
+                    st.write("\n**Recommended Resources:**")
+                    for resource in module['resources']:
+                        st.write(f"- [{resource['name']}]({resource['url']}) ({resource['platform']})")
+        except requests.HTTPError:
+            pass  # Unsuccessful response: nothing to show
         except Exception as e:
             st.error(f"Error loading learning path: {str(e)}")
 
@@ -339,17 +383,13 @@ def main():
         
         with st.spinner("🤖 AI is analyzing your profile..."):
             try:
-                response = requests.post(
-                    f"{API_URL}/recommend-careers",
-                    json=profile_data
+                recommendations, summary = fetch_recommendations(
+                    profile_cache_key(profile_data), profile_data
                 )
-                
-                if response.status_code == 200:
-                    recommendations = response.json()
-                    st.session_state['recommendations'] = recommendations
-                    render_recommendations(recommendations)
-                else:
-                    st.error("Error getting recommendations. Please try again.")
+                st.session_state['recommendations'] = recommendations
+                render_recommendations(recommendations, summary)
+            except requests.HTTPError:
+                st.error("Error getting recommendations. Please try again.")
             except Exception as e:
                 st.error(f"Error: {str(e)}")
                 st.info("Make sure the backend is running on http://localhost:8000")
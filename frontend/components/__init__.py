@@ -1,13 +1,15 @@
 """
 Frontend components package
 """
+from .api_client import get_api_session
 from .sidebar import render_sidebar
 from .visualizations import (
     create_radar_chart,
     create_skills_gap_chart,
     create_timeline_chart,
     create_salary_comparison_chart,
-    create_skills_distribution_pie
+    create_skills_distribution_pie,
+    render_skills_gap
 )
 from .career_cards import (
     render_career_card,
@@ -16,12 +18,14 @@ from .career_cards import (
 )
 
 __all__ = [
+    'get_api_session',
     'render_sidebar',
     'create_radar_chart',
     'create_skills_gap_chart',
     'create_timeline_chart',
     'create_salary_comparison_chart',
     'create_skills_distribution_pie',
+    'render_skills_gap',
     'render_career_card',
     'render_compact_career_card',
     'render_career_comparison_table'
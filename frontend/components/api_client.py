@@ -0,0 +1,28 @@
+"""
+Shared HTTP session for talking to the backend API
+"""
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+
+# Seconds to wait for the backend when a call does not pass its own timeout
+DEFAULT_TIMEOUT = 10
+
+class _APISession(requests.Session):
+    """Session that applies DEFAULT_TIMEOUT to every request"""
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+@st.cache_resource
+def get_api_session() -> requests.Session:
+    """
+    Pooled keep-alive session, created once per Streamlit server process
+    and shared across reruns and user sessions
+    """
+    session = _APISession()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -3,6 +3,16 @@ Career card components for displaying recommendations
 """
 import streamlit as st
 
+# Inline-styled skill pill: (background color, skill name)
+_SKILL_PILL_HTML = (
+    '<span style="background-color: %s; padding: 4px 8px; '
+    'border-radius: 4px; margin: 2px; display: inline-block;">%s</span>'
+)
+
+def _skill_pills_html(skills, background_color: str) -> str:
+    """Render skills as a row of colored pills"""
+    return " ".join(_SKILL_PILL_HTML % (background_color, skill) for skill in skills)
+
 def render_career_card(recommendation: dict, rank: int):
     """
     Render a single career recommendation card
@@ -43,11 +53,7 @@ def render_career_card(recommendation: dict, rank: int):
         # Matching skills
         if recommendation.get('matching_skills'):
             st.write("**✅ Your Matching Skills:**")
-            skills_html = " ".join([
-                f'<span style="background-color: #d4edda; padding: 4px 8px; '
-                f'border-radius: 4px; margin: 2px; display: inline-block;">{skill}</span>'
-                for skill in recommendation['matching_skills'][:10]
-            ])
+            skills_html = _skill_pills_html(recommendation['matching_skills'][:10], "#d4edda")
             st.markdown(skills_html, unsafe_allow_html=True)
             
             if len(recommendation['matching_skills']) > 10:
@@ -57,11 +63,7 @@ def render_career_card(recommendation: dict, rank: int):
         # Skills to learn
         if recommendation.get('skills_to_learn'):
             st.write("**📚 Skills You Need to Learn:**")
-            skills_html = " ".join([
-                f'<span style="background-color: #fff3cd; padding: 4px 8px; '
-                f'border-radius: 4px; margin: 2px; display: inline-block;">{skill}</span>'
-                for skill in recommendation['skills_to_learn']
-            ])
+            skills_html = _skill_pills_html(recommendation['skills_to_learn'], "#fff3cd")
             st.markdown(skills_html, unsafe_allow_html=True)
         else:
             st.success("🎉 You already have all the required skills!")
@@ -1,8 +1,62 @@
 """
 Sidebar component for user input
 """
-import streamlit as st
+import hashlib
+
 import requests
+import streamlit as st
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+
+from .api_client import get_api_session
+
+def resume_digest(uploaded_file) -> str:
+    """Content hash of an uploaded resume, read in place without copying"""
+    with uploaded_file.getbuffer() as view:
+        return hashlib.blake2b(view, digest_size=16).hexdigest()
+
+class ResumeParseError(Exception):
+    """The backend answered /parse-resume with status "error" """
+
+# Identical PDFs are parsed by the backend once; the digest stands in for the
+# unhashed file. Only successful parses are cached: non-200 responses raise
+# requests.HTTPError and "error" payloads raise ResumeParseError.
+@st.cache_data(ttl=3600, show_spinner=False)
+def parse_resume(file_digest, api_url, _uploaded_file):
+    """POST /parse-resume, streaming the multipart body from the upload"""
+    _uploaded_file.seek(0)
+    encoder = MultipartEncoder(fields={
+        'file': (_uploaded_file.name, _uploaded_file, 'application/pdf')
+    })
+    # Parsing large PDFs can outlast the default API timeout
+    response = get_api_session().post(
+        f"{api_url}/parse-resume",
+        data=encoder,
+        headers={'Content-Type': encoder.content_type},
+        timeout=120
+    )
+    response.raise_for_status()
+    data = response.json()
+    if data['status'] != 'success':
+        raise ResumeParseError(data.get('message', 'Unknown error'))
+    return data
+
+def split_comma_list(text: str) -> list:
+    """Non-empty, stripped items of a comma-separated input (one strip per item)"""
+    return [item for item in map(str.strip, text.split(',')) if item]
+
+def extracted_info_markdown(skills, education, experience_years) -> str:
+    """Summary of a parsed resume as one markdown block (one element to render)"""
+    paragraphs = [f"**Skills Found:** {len(skills)}"]
+    if skills:
+        paragraphs.append(", ".join(skills[:10]))
+        if len(skills) > 10:
+            paragraphs.append(f"*...and {len(skills) - 10} more*")
+    
+    if education:
+        paragraphs.append(f"**Education:** {', '.join(education)}")
+    if experience_years > 0:
+        paragraphs.append(f"**Experience:** {experience_years} years")
+    return "\n\n".join(paragraphs)
 
 def render_sidebar(api_url):
     """
@@ -25,40 +79,29 @@ def render_sidebar(api_url):
             if st.button("🔍 Parse Resume", type="primary", use_container_width=True):
                 with st.spinner("🤖 Analyzing your resume..."):
                     try:
-                        files = {
-                            'file': (uploaded_file.name, uploaded_file.getvalue(), 'application/pdf')
-                        }
-                        response = requests.post(f"{api_url}/parse-resume", files=files)
+                        data = parse_resume(
+                            resume_digest(uploaded_file), api_url, uploaded_file
+                        )
+                        
+                        st.session_state['extracted_skills'] = data.get('extracted_skills', [])
+                        st.session_state['extracted_skills_text'] = ", ".join(st.session_state['extracted_skills'])
+                        st.session_state['education'] = data.get('education', [])
+                        st.session_state['experience_years'] = data.get('experience_years', 0)
+                        st.session_state['resume_parsed'] = True
                         
-                        if response.status_code == 200:
-                            data = response.json()
-                            
-                            if data['status'] == 'success':
-                                st.session_state['extracted_skills'] = data.get('extracted_skills', [])
-                                st.session_state['education'] = data.get('education', [])
-                                st.session_state['experience_years'] = data.get('experience_years', 0)
-                                st.session_state['resume_parsed'] = True
-                                
-                                st.success(f"✅ Found {len(st.session_state['extracted_skills'])} skills!")
-                                
-                                # Show extracted info
-                                with st.expander("📊 Extracted Information", expanded=True):
-                                    st.write(f"**Skills Found:** {len(st.session_state['extracted_skills'])}")
-                                    if st.session_state['extracted_skills']:
-                                        skills_preview = st.session_state['extracted_skills'][:10]
-                                        st.write(", ".join(skills_preview))
-                                        if len(st.session_state['extracted_skills']) > 10:
-                                            remaining = len(st.session_state['extracted_skills']) - 10
-                                            st.write(f"*...and {remaining} more*")
-                                    
-                                    if st.session_state['education']:
-                                        st.write(f"**Education:** {', '.join(st.session_state['education'])}")
-                                    if st.session_state['experience_years'] > 0:
-                                        st.write(f"**Experience:** {st.session_state['experience_years']} years")
-                            else:
-                                st.error(f"❌ {data.get('message', 'Unknown error')}")
-                        else:
-                            st.error("❌ Error connecting to API")
+                        st.success(f"✅ Found {len(st.session_state['extracted_skills'])} skills!")
+                        
+                        # Show extracted info
+                        with st.expander("📊 Extracted Information", expanded=True):
+                            st.markdown(extracted_info_markdown(
+                                st.session_state['extracted_skills'],
+                                st.session_state['education'],
+                                st.session_state['experience_years']
+                            ))
+                    except ResumeParseError as e:
+                        st.error(f"❌ {e}")
+                    except requests.HTTPError:
+                        st.error("❌ Error connecting to API")
                     except Exception as e:
                         st.error(f"❌ Error: {str(e)}")
                         st.info("💡 Make sure backend is running: `uvicorn main:app --reload`")
@@ -68,67 +111,69 @@ def render_sidebar(api_url):
         # Manual input section
         st.subheader("✏️ Manual Input")
         
-        # Skills input with extracted skills as default
-        default_skills = ", ".join(st.session_state.get('extracted_skills', []))
-        
-        skills_input = st.text_area(
-            "Your Skills (comma-separated)",
-            value=default_skills,
-            placeholder="Python, Machine Learning, SQL, Git...",
-            height=100,
-            help="Edit or add skills manually"
-        )
-        
-        interests_input = st.text_input(
-            "Interests",
-            placeholder="Data Science, AI, Web Development...",
-            help="What fields interest you?"
-        )
-        
-        education = st.selectbox(
-            "Education Level",
-            ["High School", "Bachelor's", "Master's", "PhD"],
-            index=1
-        )
-        
-        gpa = st.slider(
-            "GPA (optional)", 
-            0.0, 4.0, 3.5, 0.1,
-            help="Your current GPA"
-        )
-        
-        experience_years = st.number_input(
-            "Years of Experience",
-            min_value=0,
-            max_value=50,
-            value=st.session_state.get('experience_years', 0),
-            help="Total years of professional experience"
-        )
-        
-        st.divider()
-        
-        # Analyze button
-        analyze_button = st.button(
-            "🚀 Get Career Recommendations", 
-            type="primary", 
-            use_container_width=True
-        )
+        # Profile fields only rerun the app when the form is submitted
+        with st.form("profile", border=False):
+            # Skills input with extracted skills as default (joined once, when parsed)
+            default_skills = st.session_state.get('extracted_skills_text', "")
+            
+            skills_input = st.text_area(
+                "Your Skills (comma-separated)",
+                value=default_skills,
+                placeholder="Python, Machine Learning, SQL, Git...",
+                height=100,
+                help="Edit or add skills manually"
+            )
+            
+            interests_input = st.text_input(
+                "Interests",
+                placeholder="Data Science, AI, Web Development...",
+                help="What fields interest you?"
+            )
+            
+            education = st.selectbox(
+                "Education Level",
+                ["High School", "Bachelor's", "Master's", "PhD"],
+                index=1
+            )
+            
+            gpa = st.slider(
+                "GPA (optional)", 
+                0.0, 4.0, 3.5, 0.1,
+                help="Your current GPA"
+            )
+            
+            experience_years = st.number_input(
+                "Years of Experience",
+                min_value=0,
+                max_value=50,
+                value=st.session_state.get('experience_years', 0),
+                help="Total years of professional experience"
+            )
+            
+            st.divider()
+            
+            # Analyze button (submits the whole form in one rerun)
+            analyze_button = st.form_submit_button(
+                "🚀 Get Career Recommendations", 
+                type="primary", 
+                use_container_width=True
+            )
         
-        # Prepare profile data
+        # Prepare profile data, only when the form is submitted
         profile_data = None
-        if skills_input.strip():
-            skills = [s.strip() for s in skills_input.split(',') if s.strip()]
-            interests = [i.strip() for i in interests_input.split(',') if i.strip()]
+        if analyze_button:
+            skills = split_comma_list(skills_input)
             
-            profile_data = {
-                "skills": skills,
-                "interests": interests,
-                "education_level": education,
-                "gpa": gpa,
-                "experience_years": experience_years
-            }
-        elif analyze_button:
-            st.warning("⚠️ Please enter your skills or upload a resume!")
+            if skills:
+                profile_data = {
+                    "skills": skills,
+                    "interests": split_comma_list(interests_input),
+                    "education_level": education,
+                    "gpa": gpa,
+                    "experience_years": experience_years
+                }
+            else:
+                st.warning("⚠️ Please enter your skills or upload a resume!")
         
         # Additional info
         st.divider()
@@ -1,9 +1,66 @@
 """
 Visualization components using Plotly
 """
+import re
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
-from typing import List, Dict
+import plotly.io as pio
+import streamlit as st
+from typing import List, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON encoder; fall back to stdlib json
+    orjson = None
+
+# st.plotly_chart serializes figures with plotly.io.to_json, which honors this
+if orjson is not None:
+    pio.json.config.default_engine = 'orjson'
+
+# Each create_* function reduces its input to the tuples the chart actually
+# uses and delegates to a cached builder, so reruns with unchanged data reuse
+# the built figure instead of constructing it again. The caches are shared by
+# all sessions, so each builder keeps at most 256 figures for up to an hour.
+
+# Salary range such as "$120,000 - $160,000" or "$150,000 - $200,000+"
+_SALARY_RE = re.compile(r'(\d[\d,]*)(?:\D+(\d[\d,]*))?')
+_STRIP_COMMAS = str.maketrans('', '', ',')
+
+# Timeline bar color per module difficulty (unknown levels fall back to blue)
+_DIFFICULTY_COLORS = MappingProxyType({
+    'beginner': '#4CAF50',
+    'intermediate': '#FF9800',
+    'advanced': '#F44336'
+})
+
+# Slice colors for the skills-by-category pie
+_CATEGORY_PALETTE = ('#4CAF50', '#2196F3', '#FF9800', '#F44336', '#9C27B0', '#00BCD4')
+
+# Width ($K) drawn for a single-figure salary so its bar stays visible
+_MIN_SALARY_BAR_K = 2.0
+
+# Skills gaps up to this size are shown as a table instead of a Plotly chart
+SKILLS_GAP_TABLE_MAX = 30
+_SKILL_STATUS_STYLES = {
+    'Have': 'background-color: #4CAF50',
+    'Need': 'background-color: #FF9800'
+}
+
+def _empty_figure(message: str) -> go.Figure:
+    """Blank figure carrying a centered placeholder message"""
+    fig = go.Figure()
+    fig.add_annotation(
+        text=message,
+        xref="paper",
+        yref="paper",
+        x=0.5,
+        y=0.5,
+        showarrow=False
+    )
+    return fig
 
 def create_radar_chart(recommendations: List[Dict]) -> go.Figure:
     """
@@ -11,14 +68,20 @@ def create_radar_chart(recommendations: List[Dict]) -> go.Figure:
     """
     # Take top 5 careers
     top_careers = recommendations[:5]
-    careers = [rec['career'] for rec in top_careers]
-    scores = [rec['match_score'] for rec in top_careers]
+    careers = tuple(rec['career'] for rec in top_careers)
+    scores = tuple(rec['match_score'] for rec in top_careers)
+    return _build_radar_chart(careers, scores)
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _build_radar_chart(careers: Tuple[str, ...], scores: Tuple[float, ...]) -> go.Figure:
+    if not careers:
+        return _empty_figure("No recommendations available")
     
     fig = go.Figure()
     
     fig.add_trace(go.Scatterpolar(
-        r=scores,
-        theta=careers,
+        r=list(scores),
+        theta=list(careers),
         fill='toself',
         name='Match Score',
         line_color='#4CAF50',
@@ -48,33 +111,18 @@ def create_skills_gap_chart(matching_skills: List[str], missing_skills: List[str
     """
     Create bar chart showing skills gap
     """
+    return _build_skills_gap_chart(tuple(matching_skills), tuple(missing_skills))
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _build_skills_gap_chart(matching_skills: Tuple[str, ...], missing_skills: Tuple[str, ...]) -> go.Figure:
     # Prepare data
-    skills = []
-    status = []
-    colors = []
-    
-    for skill in matching_skills:
-        skills.append(skill)
-        status.append('Have')
-        colors.append('#4CAF50')
-    
-    for skill in missing_skills:
-        skills.append(skill)
-        status.append('Need')
-        colors.append('#FF9800')
+    n_have, n_need = len(matching_skills), len(missing_skills)
+    skills = list(matching_skills + missing_skills)
+    status = ['Have'] * n_have + ['Need'] * n_need
+    colors = ['#4CAF50'] * n_have + ['#FF9800'] * n_need
     
     if not skills:
-        # Empty chart
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No skills data available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False
-        )
-        return fig
+        return _empty_figure("No skills data available")
     
     fig = go.Figure()
     
@@ -103,130 +151,164 @@ def create_skills_gap_chart(matching_skills: List[str], missing_skills: List[str
     
     return fig
 
-def create_timeline_chart(learning_path: List[Dict]) -> go.Figure:
+def render_skills_gap(matching_skills: List[str], missing_skills: List[str]):
     """
-    Create Gantt-style timeline for learning path
+    Render the skills gap: a colored Have/Need table for typical gaps,
+    the bar chart only when there are too many skills for a table
     """
-    if not learning_path:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No learning path available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False
+    if len(matching_skills) + len(missing_skills) > SKILLS_GAP_TABLE_MAX:
+        st.plotly_chart(
+            create_skills_gap_chart(matching_skills, missing_skills),
+            use_container_width=True
         )
-        return fig
+        return
     
-    # Calculate cumulative weeks for timeline
-    start_week = 0
-    timeline_data = []
-    
-    for module in learning_path:
-        end_week = start_week + module['estimated_weeks']
-        
-        timeline_data.append({
-            'Skill': module['skill'],
-            'Start': start_week,
-            'Finish': end_week,
-            'Duration': module['estimated_weeks'],
-            'Difficulty': module['difficulty']
-        })
-        
-        start_week = end_week
+    df = pd.DataFrame({
+        'Skill': list(matching_skills) + list(missing_skills),
+        'Status': ['Have'] * len(matching_skills) + ['Need'] * len(missing_skills)
+    })
+    st.dataframe(
+        df.style.map(_SKILL_STATUS_STYLES.get, subset=['Status']),
+        use_container_width=True,
+        hide_index=True
+    )
+
+def create_timeline_chart(learning_path: List[Dict]) -> go.Figure:
+    """
+    Create Gantt-style timeline for learning path
+    """
+    return _build_timeline_chart(tuple(
+        (module['skill'], module['estimated_weeks'], module['difficulty'])
+        for module in learning_path
+    ))
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _build_timeline_chart(modules: Tuple[Tuple[str, int, str], ...]) -> go.Figure:
+    if not modules:
+        return _empty_figure("No learning path available")
     
-    # Color mapping for difficulty
-    color_map = {
-        'beginner': '#4CAF50',
-        'intermediate': '#FF9800',
-        'advanced': '#F44336'
-    }
+    # Cumulative weeks for timeline, one array per column
+    skills, weeks, difficulties = zip(*modules)
+    weeks = np.fromiter(weeks, dtype=np.int64, count=len(modules))
+    finishes = np.cumsum(weeks)
+    starts = finishes - weeks
     
-    colors = [color_map.get(d['Difficulty'], '#2196F3') for d in timeline_data]
+    colors = [_DIFFICULTY_COLORS.get(d, '#2196F3') for d in difficulties]
     
+    # One trace for the whole path; per-module values ride along in customdata
     fig = go.Figure()
     
-    for idx, data in enumerate(timeline_data):
-        fig.add_trace(go.Bar(
-            y=[data['Skill']],
-            x=[data['Duration']],
-            base=data['Start'],
-            orientation='h',
-            name=data['Skill'],
-            marker=dict(color=colors[idx]),
-            text=f"{data['Duration']} weeks",
-            textposition='inside',
-            hovertemplate=(
-                f"<b>{data['Skill']}</b><br>"
-                f"Week {data['Start']} - {data['Finish']}<br>"
-                f"Duration: {data['Duration']} weeks<br>"
-                f"Difficulty: {data['Difficulty'].title()}"
-                "<extra></extra>"
-            )
-        ))
+    fig.add_trace(go.Bar(
+        y=list(skills),
+        x=weeks,
+        base=starts,
+        orientation='h',
+        marker=dict(color=colors),
+        text=[f"{w} weeks" for w in weeks.tolist()],
+        textposition='inside',
+        customdata=list(zip(
+            starts.tolist(), finishes.tolist(), [d.title() for d in difficulties]
+        )),
+        hovertemplate=(
+            "<b>%{y}</b><br>"
+            "Week %{customdata[0]} - %{customdata[1]}<br>"
+            "Duration: %{x} weeks<br>"
+            "Difficulty: %{customdata[2]}"
+            "<extra></extra>"
+        )
+    ))
     
     fig.update_layout(
         title="Learning Timeline (Gantt Chart)",
         xaxis_title="Weeks",
         yaxis_title="Skills",
         showlegend=False,
-        height=max(400, len(timeline_data) * 50),
-        barmode='overlay',
+        height=max(400, len(modules) * 50),
         yaxis=dict(autorange="reversed")
     )
     
     return fig
 
+def _salary_range_k(salary_str: str) -> Tuple[float, float]:
+    """
+    Parse a salary string (e.g. "$120,000 - $160,000") into (min, max) in
+    thousands; a single figure is both bounds, no figure is (0, 0)
+    """
+    match = _SALARY_RE.search(salary_str)
+    if not match:
+        return 0.0, 0.0
+    low, high = match.groups()
+    min_sal = int(low.translate(_STRIP_COMMAS))
+    max_sal = int(high.translate(_STRIP_COMMAS)) if high else min_sal
+    return min_sal / 1000, max_sal / 1000
+
 def create_salary_comparison_chart(recommendations: List[Dict]) -> go.Figure:
     """
     Create bar chart comparing salaries across careers
     """
-    careers = []
-    min_salaries = []
-    max_salaries = []
+    return _build_salary_comparison_chart(tuple(
+        (rec['career'], *_salary_range_k(rec.get('salary_info', '$0 - $0')))
+        for rec in recommendations[:6]
+    ))
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _build_salary_comparison_chart(salaries: Tuple[Tuple[str, float, float], ...]) -> go.Figure:
+    if not salaries:
+        return _empty_figure("No salary data available")
     
-    for rec in recommendations[:6]:
-        careers.append(rec['career'])
-        
-        # Parse salary string (e.g., "$120,000 - $160,000")
-        salary_str = rec.get('salary_info', '$0 - $0')
-        try:
-            parts = salary_str.replace('$', '').replace(',', '').split('-')
-            min_sal = int(parts[0].strip())
-            max_sal = int(parts[1].strip().split()[0]) if len(parts) > 1 else min_sal
-        except:
-            min_sal = 0
-            max_sal = 0
-        
-        min_salaries.append(min_sal / 1000)  # Convert to thousands
-        max_salaries.append(max_sal / 1000)
+    careers = [career for career, _, _ in salaries]
+    # Careers without a salary figure (parsed as 0) get no bar, only an "n/a" label
+    known = [(career, min_k, max_k) for career, min_k, max_k in salaries if min_k > 0]
+    widths = []
+    bases = []
+    for _, min_k, max_k in known:
+        if max_k > min_k:
+            widths.append(max_k - min_k)
+            bases.append(min_k)
+        else:
+            # Single figure: a narrow bar centered on it
+            widths.append(_MIN_SALARY_BAR_K)
+            bases.append(min_k - _MIN_SALARY_BAR_K / 2)
     
+    # One floating bar per career spanning its min..max range
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        name='Min Salary',
-        y=careers,
-        x=min_salaries,
+        name='Salary Range',
+        y=[career for career, _, _ in known],
+        x=widths,
+        base=bases,
         orientation='h',
-        marker=dict(color='#64B5F6')
+        marker=dict(color='#1976D2'),
+        customdata=[(min_k, max_k) for _, min_k, max_k in known],
+        hovertemplate=(
+            "<b>%{y}</b><br>"
+            "Min $%{customdata[0]:.0f}K - Max $%{customdata[1]:.0f}K"
+            "<extra></extra>"
+        )
     ))
     
-    fig.add_trace(go.Bar(
-        name='Max Salary',
-        y=careers,
-        x=max_salaries,
-        orientation='h',
-        marker=dict(color='#1976D2')
-    ))
+    for career, min_k, _ in salaries:
+        if min_k <= 0:
+            fig.add_annotation(
+                text="n/a",
+                xref="paper",
+                x=0,
+                xanchor="left",
+                y=career,
+                showarrow=False
+            )
     
     fig.update_layout(
         title='Salary Comparison (in thousands)',
         xaxis_title='Salary ($K)',
         yaxis_title='Career',
-        barmode='group',
         height=400,
-        yaxis=dict(autorange="reversed")
+        yaxis=dict(
+            categoryorder="array",
+            categoryarray=careers,
+            autorange="reversed"
+        )
     )
     
     return fig
@@ -235,28 +317,23 @@ def create_skills_distribution_pie(skills_by_category: Dict[str, List[str]]) ->
     """
     Create pie chart showing skills distribution by category
     """
-    if not skills_by_category:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No skills categorization available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False
-        )
-        return fig
+    return _build_skills_distribution_pie(tuple(
+        (category, len(skills)) for category, skills in skills_by_category.items()
+    ))
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _build_skills_distribution_pie(category_counts: Tuple[Tuple[str, int], ...]) -> go.Figure:
+    if not category_counts:
+        return _empty_figure("No skills categorization available")
     
-    categories = list(skills_by_category.keys())
-    counts = [len(skills) for skills in skills_by_category.values()]
+    categories = [category for category, _ in category_counts]
+    counts = [count for _, count in category_counts]
     
     fig = go.Figure(data=[go.Pie(
         labels=categories,
         values=counts,
         hole=.3,
-        marker=dict(
-            colors=['#4CAF50', '#2196F3', '#FF9800', '#F44336', '#9C27B0', '#00BCD4']
-        )
+        marker=dict(colors=_CATEGORY_PALETTE)
     )])
     
     fig.update_layout(
@@ -0,0 +1,34 @@
+"""
+Tests for resume skill extraction
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+from backend import parser
+from backend.parser import ResumeParser
+
+
+@pytest.fixture(params=["automaton", "find"])
+def scanner(request, monkeypatch):
+    """Run each test with the Aho-Corasick scanner and the str.find fallback"""
+    if request.param == "find":
+        monkeypatch.setattr(parser, "_SKILL_AUTOMATON", None)
+    elif parser._SKILL_AUTOMATON is None:
+        pytest.skip("pyahocorasick not installed")
+
+
+def test_symbol_edged_skills_match_before_versions(scanner):
+    skills, _ = ResumeParser.extract_skills("Worked with C++17 and C#10 daily")
+    assert "C++" in skills
+    assert "C#" in skills
+
+
+def test_word_edged_skills_need_word_boundaries(scanner):
+    skills, _ = ResumeParser.extract_skills("Built services in scala")
+    assert "Scala" in skills
+    assert "C" not in skills